@@ -1,15 +1,28 @@
 
+from __future__ import annotations
+
+import datetime
+import hmac
+import logging
 import os
-import pickle
+import sys
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 
-from fastapi import FastAPI, Depends, HTTPException, status, Path, Query
+import msgspec
+import orjson
+
+from fastapi import APIRouter, FastAPI, Depends, Header, HTTPException, Request, status, Path, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 
 # --- Configuration & Setup ---
 
+logger = logging.getLogger(__name__)
+
 PROJECT_NAME = "Portfolio Website with Blog"
+_UTC = datetime.timezone.utc
 
 # CORS configuration
 CORS_ALLOWED_ORIGINS = ["*"] # Allow all origins as per requirement
@@ -18,6 +31,11 @@ CORS_ALLOWED_ORIGINS = ["*"] # Allow all origins as per requirement
 AI_ENABLED = True # Based on BACKEND_PLAN: ai.enabled: true
 MODEL_PATH = "model.pkl" # Not actually loaded, just for illustrative purposes
 PREPROCESSOR_PATH = "preprocessor.pkl" # Not actually loaded, just for illustrative purposes
+PREDICTION_PRECISIONS = ("float32", "int8") # "int8" quantizes inputs before scoring
+PREDICTION_PRECISION = os.getenv("PREDICTION_PRECISION", "float32")
+if PREDICTION_PRECISION not in PREDICTION_PRECISIONS:
+    raise ValueError(f"PREDICTION_PRECISION must be one of {PREDICTION_PRECISIONS}, got {PREDICTION_PRECISION!r}")
+PREDICTION_STREAM_CHUNK_SIZE = 4096 # /predict streams results larger than this, encoding one chunk at a time
 
 # Admin Authentication Configuration
 FAKE_ADMIN_TOKEN = "supersecretadmintoken" # In a real app, this would be a secure token/JWT
@@ -34,49 +52,148 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=CORS_ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["X-Admin-Token", "Content-Type"],
+    max_age=86400, # Let browsers cache preflight results for a day
 )
 
 # --- AI Model Loading (Stubbed) ---
 
+def _columns_to_array(columns: Dict[str, List[float]]) -> np.ndarray:
+    """
+    Converts equal-length feature columns into a 2-D float32 array with one row per
+    data point, backed by a single buffer. Values outside the float32 range are rejected.
+    """
+    if not columns:
+        return np.empty((0, 0), dtype=np.float32)
+    if len({len(values) for values in columns.values()}) > 1:
+        raise ValueError("All columns must have the same number of values")
+    # Out-of-range values overflow to inf here; they are rejected just below.
+    with np.errstate(over="ignore"):
+        arr = np.asarray(list(columns.values()), dtype=np.float32)
+    if not (np.isfinite(arr) | np.isnan(arr)).all():
+        raise ValueError("Values must be finite and within the float32 range")
+    return arr.T
+
+def _records_to_array(data: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Converts a list of records into a 2-D float array with one row per record and one
+    column per key. Missing or non-numeric values become NaN, as do non-dict entries.
+    """
+    rows = [i for i, item in enumerate(data) if isinstance(item, dict)]
+    records = [data[i] for i in rows]
+    keys = list(dict.fromkeys(k for item in records for k in item))
+    values = np.fromiter(
+        (
+            v if isinstance(v := item.get(k), (int, float)) else np.nan
+            for item in records
+            for k in keys
+        ),
+        dtype=np.float64,
+        count=len(records) * len(keys),
+    ).reshape(len(records), len(keys))
+    if len(rows) == len(data):
+        return values
+    arr = np.full((len(data), len(keys)), np.nan)
+    arr[rows] = values
+    return arr
+
+def _score_numpy(arr: np.ndarray, scale: float) -> np.ndarray:
+    """Row means over the non-NaN values of `arr` times `scale`, 0.5 for rows without any."""
+    valid = ~np.isnan(arr)
+    counts = valid.sum(axis=1)
+    # Accumulate in float64, like `_score_loop`, even when the input is float32.
+    sums = np.where(valid, arr, 0.0).sum(axis=1, dtype=np.float64)
+    out = np.full(arr.shape[0], 0.5)
+    np.divide(sums * scale, counts, out=out, where=counts > 0)
+    return out
+
+def _score_loop(arr: np.ndarray, scale: float) -> np.ndarray:
+    """Same as `_score_numpy`, written as a plain loop for numba to compile."""
+    out = np.empty(arr.shape[0])
+    for i in range(arr.shape[0]):
+        s = 0.0
+        n = 0
+        for j in range(arr.shape[1]):
+            v = float(arr[i, j])
+            if not np.isnan(v):
+                s += v
+                n += 1
+        out[i] = s * scale / n if n > 0 else 0.5
+    return out
+
+def _score_int8(arr: np.ndarray, scale: float) -> np.ndarray:
+    """
+    Same as `_score_numpy`, but sums int8-quantized values (symmetric, per-tensor scale).
+    An accuracy demo for quantized scoring: the float input is still read in full, so
+    it is not faster. Inputs containing infinities cannot be quantized and are scored
+    unquantized.
+    """
+    valid = ~np.isnan(arr)
+    values = np.where(valid, arr, 0.0)
+    max_abs = float(np.abs(values).max()) if values.size else 0.0
+    if not np.isfinite(max_abs):
+        return _score_numpy(arr, scale)
+    q_scale = 127.0 / max_abs if max_abs > 0 else 1.0
+    # In float64: for tiny inputs q_scale itself exceeds the float32 range.
+    q = np.rint(np.multiply(values, q_scale, dtype=np.float64)).astype(np.int8)
+    counts = valid.sum(axis=1)
+    sums = q.sum(axis=1, dtype=np.int32)
+    out = np.full(arr.shape[0], 0.5)
+    np.divide(sums * (scale / q_scale), counts, out=out, where=counts > 0)
+    return out
+
+def _build_score_kernel():
+    """
+    Compiles `_score_loop` with numba and warms it up so the first request doesn't pay
+    for compilation. Falls back to `_score_numpy` if numba is missing or fails.
+    """
+    if njit is None:
+        return _score_numpy
+    try:
+        # fastmath is left off: it assumes no NaNs, which would break the missing-value check.
+        kernel = njit(cache=True)(_score_loop)
+        # Column input arrives as transposed float32 (column-major); a single transposed
+        # column is C-contiguous, which numba compiles separately. Legacy record input
+        # stays row-major float64 so its results match the original endpoint.
+        kernel(np.zeros((2, 2), dtype=np.float32).T, 1.0)
+        kernel(np.zeros((1, 2), dtype=np.float32).T, 1.0)
+        kernel(np.zeros((2, 2)), 1.0)
+    except Exception as e:
+        print(f"Warning: Could not compile the numba scoring kernel. Reason: {e}. Falling back to NumPy.")
+        return _score_numpy
+    return kernel
+
 class MockModel:
     """A mock machine learning model for demonstration purposes."""
-    def predict(self, data: List[Dict[str, Any]]) -> List[float]:
+    def __init__(self, precision: str = "float32"):
+        if precision not in PREDICTION_PRECISIONS:
+            raise ValueError(f"Unsupported prediction precision: {precision!r}")
+        self.precision = precision
+
+    def predict(self, arr: np.ndarray, scale: float = 1.0) -> List[float]:
         """
         Mocks a prediction. In a real scenario, this would use the loaded model.
-        Returns a list of dummy scores based on input data.
+        Returns the mean of the numeric values of each row, or 0.5 for rows without any.
+        `scale` lets a preprocessor's scaling be applied in the same pass.
         """
-        print(f"MockModel received data for prediction: {data}")
-        # Example: return average of numeric values, or a fixed score
-        predictions = []
-        for item in data:
-            if isinstance(item, dict):
-                numeric_values = [v for v in item.values() if isinstance(v, (int, float))]
-                if numeric_values:
-                    predictions.append(sum(numeric_values) / len(numeric_values))
-                else:
-                    predictions.append(0.5) # Default score if no numeric values
-            else:
-                predictions.append(0.5)
-        return predictions
+        logger.debug("MockModel received %d rows for prediction", arr.shape[0])
+        if self.precision == "int8":
+            return _score_int8(arr, scale).tolist()
+        return _score(arr, scale).tolist()
 
 class MockPreprocessor:
     """A mock data preprocessor for demonstration purposes."""
-    def preprocess(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    scale = 10.0
+
+    def preprocess(self, arr: np.ndarray) -> np.ndarray:
         """
         Mocks data preprocessing. In a real scenario, this would apply transformations.
-        Returns the data with a simple modification.
+        Scales the input array by 10 in place and returns it.
         """
-        print(f"MockPreprocessor received data for preprocessing: {data}")
-        processed_data = []
-        for item in data:
-            if isinstance(item, dict):
-                processed_item = {f"processed_{k}": v * 10 if isinstance(v, (int, float)) else v for k, v in item.items()}
-                processed_data.append(processed_item)
-            else:
-                processed_data.append(item)
-        return processed_data
+        logger.debug("MockPreprocessor received %d rows for preprocessing", arr.shape[0])
+        arr *= self.scale
+        return arr
 
 # Global variables for AI models
 ml_model: Optional[MockModel] = None
@@ -84,6 +201,17 @@ preprocessor: Optional[MockPreprocessor] = None
 
 if AI_ENABLED:
     try:
+        # NumPy and numba are only needed for inference, so they are imported here
+        # rather than at the top to keep AI-less deployments light.
+        import numpy as np
+
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional; _score falls back to the NumPy implementation
+            njit = None
+
+        _score = _build_score_kernel()
+
         # In a real application, these files would be loaded from disk:
         # with open(MODEL_PATH, "rb") as f:
         #     ml_model = pickle.load(f)
@@ -91,10 +219,10 @@ if AI_ENABLED:
         #     preprocessor = pickle.load(f)
 
         # For this stub, we instantiate our mock objects
-        ml_model = MockModel()
+        ml_model = MockModel(precision=PREDICTION_PRECISION)
         preprocessor = MockPreprocessor()
         print(f"AI models (mocked) '{MODEL_PATH}' and '{PREPROCESSOR_PATH}' initialized successfully.")
-    except (FileNotFoundError, EOFError, pickle.UnpicklingError) as e:
+    except (FileNotFoundError, EOFError) as e:
         print(f"Warning: Could not load AI models. Reason: {e}. AI prediction will be unavailable.")
         AI_ENABLED = False # Disable AI if loading fails
     except Exception as e:
@@ -103,38 +231,69 @@ if AI_ENABLED:
 
 # --- Pydantic Models ---
 
+# Requests are decoded with `PredictionInputStruct`; this model only documents the body in OpenAPI.
+class PredictionInputSoA(BaseModel):
+    """
+    Input schema for the AI prediction endpoint: a mapping of feature name to its values,
+    one value per data point. All columns must have the same length.
+    """
+    columns: Dict[str, List[float]]
+
+    model_config = ConfigDict(json_schema_extra={
+        "examples": [{"columns": {"feature1": [10, 5], "feature2": [20, 15]}}]
+    })
+
+class PredictionInputStruct(msgspec.Struct):
+    """msgspec mirror of `PredictionInputSoA`, decoded straight from the request body."""
+    columns: Dict[str, List[float]]
+
 class PredictionInput(BaseModel):
-    """Input schema for the AI prediction endpoint."""
-    data: List[Dict[str, Any]] = Field(
-        ...,
-        example=[{"feature1": 10, "feature2": 20}, {"feature1": 5, "feature2": 15}],
-        description="A list of dictionaries, where each dictionary represents a data point for prediction."
-    )
+    """
+    Input schema for the legacy record-based AI prediction endpoint: a list of dictionaries,
+    where each dictionary represents a data point for prediction.
+    """
+    data: List[Dict[str, Any]]
+
+    model_config = ConfigDict(json_schema_extra={
+        "examples": [{"data": [{"feature1": 10, "feature2": 20}, {"feature1": 5, "feature2": 15}]}]
+    })
 
 class PredictionOutput(BaseModel):
-    """Output schema for the AI prediction endpoint."""
-    predictions: List[float] = Field(
-        ...,
-        example=[0.75, 0.62],
-        description="A list of prediction scores corresponding to the input data points."
-    )
+    """
+    Output schema for the AI prediction endpoint: a list of prediction scores
+    corresponding to the input data points.
+    """
+    predictions: List[float]
     status: str = "success"
 
+    model_config = ConfigDict(json_schema_extra={
+        "examples": [{"predictions": [0.75, 0.62], "status": "success"}]
+    })
+
 class HealthCheckResponse(BaseModel):
     """Response model for the health check endpoint."""
-    status: str = Field(..., example="healthy")
-    timestamp: str = Field(..., example="2023-10-27T10:00:00Z")
-    service: str = Field(..., example=PROJECT_NAME)
+    status: str
+    timestamp: str
+    service: str
+
+    model_config = ConfigDict(json_schema_extra={
+        "examples": [{"status": "healthy", "timestamp": "2023-10-27T10:00:00Z", "service": PROJECT_NAME}]
+    })
 
 
 # --- Authentication Dependency ---
 
-def authenticate_admin(token: str = Depends(lambda x: x.headers.get("X-Admin-Token"))) -> bool:
+@lru_cache(maxsize=256)
+def _is_valid_admin_token(token: str) -> bool:
+    """Constant-time check of `token` against `FAKE_ADMIN_TOKEN`, memoized per token."""
+    return hmac.compare_digest(token.encode(), FAKE_ADMIN_TOKEN.encode())
+
+def authenticate_admin(x_admin_token: Optional[str] = Header(default=None, alias="X-Admin-Token")) -> bool:
     """
     Dependency to authenticate admin users.
     Checks for a specific header `X-Admin-Token` with `FAKE_ADMIN_TOKEN`.
     """
-    if not token or token != FAKE_ADMIN_TOKEN:
+    if not x_admin_token or not _is_valid_admin_token(x_admin_token):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication failed: Invalid or missing admin token",
@@ -142,89 +301,120 @@ def authenticate_admin(token: str = Depends(lambda x: x.headers.get("X-Admin-Tok
         )
     return True
 
+# --- Response Helpers ---
+
+def _json_response(content: Any) -> Response:
+    """Encodes `content` with orjson into a response that can be sent, and reused, as is."""
+    return Response(content=orjson.dumps(content), media_type="application/json")
+
+# --- Static Page Responses ---
+# These pages never change, so each response is encoded once at import time and reused.
+_HOME_RESP = _json_response({"message": "Welcome to my Portfolio!", "page": "Home"})
+_ABOUT_RESP = _json_response({"message": "Learn more about me here.", "page": "About"})
+_PORTFOLIO_RESP = _json_response({"message": "Here are my projects.", "page": "Portfolio", "projects": ["Project A", "Project B", "Project C"]})
+_BLOG_RESP = _json_response({"message": "Welcome to my blog!", "page": "Blog", "posts": ["Post 1", "Post 2", "Post 3"]})
+_CONTACT_RESP = _json_response({"message": "Get in touch with me!", "page": "Contact", "email": "contact@example.com"})
+_ADMIN_LOGIN_RESP = _json_response({"message": "Admin login portal. Please provide credentials.", "page": "Admin Login"})
+_ADMIN_DASHBOARD_RESP = _json_response({"message": "Welcome to the Admin Dashboard!", "page": "Admin Dashboard", "status": "authenticated"})
+_ADMIN_POSTS_RESP = _json_response({"message": "Manage your blog posts here.", "page": "Admin Posts", "posts_count": 5})
+
+# Detail pages depend only on the slug, so encoded responses are memoized per slug.
+# The caches are bounded because slugs come straight from the request path.
+@lru_cache(maxsize=1024)
+def _portfolio_resp(slug: str) -> Response:
+    return _json_response({"message": f"Details for project: {slug}", "page": "Portfolio Detail", "project_slug": slug})
+
+@lru_cache(maxsize=1024)
+def _blog_post_resp(slug: str) -> Response:
+    return _json_response({"message": f"Details for blog post: {slug}", "page": "Blog Post Detail", "post_slug": slug})
+
 # --- Public Routes ---
 
 @app.get("/", summary="Home Page")
 async def read_home():
     """Returns data for the home page."""
-    return {"message": "Welcome to my Portfolio!", "page": "Home"}
+    return _HOME_RESP
 
 @app.get("/about", summary="About Page")
 async def read_about():
     """Returns data for the about page."""
-    return {"message": "Learn more about me here.", "page": "About"}
+    return _ABOUT_RESP
 
 @app.get("/portfolio", summary="Portfolio Page")
 async def read_portfolio():
     """Returns a list of portfolio projects."""
-    return {"message": "Here are my projects.", "page": "Portfolio", "projects": ["Project A", "Project B", "Project C"]}
+    return _PORTFOLIO_RESP
 
 @app.get("/portfolio/{slug}", summary="Portfolio Project Detail Page")
 async def read_portfolio_item(slug: str = Path(..., title="The slug of the portfolio project")):
     """Returns details for a specific portfolio project."""
-    return {"message": f"Details for project: {slug}", "page": "Portfolio Detail", "project_slug": slug}
+    return _portfolio_resp(slug)
 
 @app.get("/blog", summary="Blog Page")
 async def read_blog():
     """Returns a list of blog posts."""
-    return {"message": "Welcome to my blog!", "page": "Blog", "posts": ["Post 1", "Post 2", "Post 3"]}
+    return _BLOG_RESP
 
 @app.get("/blog/{slug}", summary="Blog Post Detail Page")
 async def read_blog_post(slug: str = Path(..., title="The slug of the blog post")):
     """Returns details for a specific blog post."""
-    return {"message": f"Details for blog post: {slug}", "page": "Blog Post Detail", "post_slug": slug}
+    return _blog_post_resp(slug)
 
 @app.get("/contact", summary="Contact Page")
 async def read_contact():
     """Returns information for the contact page."""
-    return {"message": "Get in touch with me!", "page": "Contact", "email": "contact@example.com"}
+    return _CONTACT_RESP
 
 # --- Admin Routes ---
 
 @app.get("/admin/login", summary="Admin Login Page")
 async def admin_login_page():
     """Returns a message for the admin login page (no authentication required for the page itself)."""
-    return {"message": "Admin login portal. Please provide credentials.", "page": "Admin Login"}
+    return _ADMIN_LOGIN_RESP
+
+# Every route on this router requires authentication.
+admin_router = APIRouter(prefix="/admin", dependencies=[Depends(authenticate_admin)])
 
-@app.get("/admin/dashboard", summary="Admin Dashboard", dependencies=[Depends(authenticate_admin)])
+@admin_router.get("/dashboard", summary="Admin Dashboard")
 async def admin_dashboard():
     """Returns data for the admin dashboard (requires authentication)."""
-    return {"message": "Welcome to the Admin Dashboard!", "page": "Admin Dashboard", "status": "authenticated"}
+    return _ADMIN_DASHBOARD_RESP
 
-@app.get("/admin/posts", summary="Admin Post Management Page", dependencies=[Depends(authenticate_admin)])
+@admin_router.get("/posts", summary="Admin Post Management Page")
 async def admin_posts():
     """Returns a list of posts for admin management (requires authentication)."""
-    return {"message": "Manage your blog posts here.", "page": "Admin Posts", "posts_count": 5}
+    return _ADMIN_POSTS_RESP
 
-@app.get("/admin/posts/edit/{post_id}", summary="Admin Post Editor Page", dependencies=[Depends(authenticate_admin)])
+@admin_router.get("/posts/edit/{post_id}", summary="Admin Post Editor Page")
 async def admin_edit_post(post_id: int = Path(..., title="The ID of the post to edit")):
     """Returns data for editing a specific post (requires authentication)."""
     return {"message": f"Editing post with ID: {post_id}", "page": "Admin Post Editor", "post_id": post_id}
 
+app.include_router(admin_router)
+
 # --- Utility Routes ---
 
-@app.get("/health", response_model=HealthCheckResponse, summary="Health Check Endpoint")
+@app.get(
+    "/health",
+    responses={200: {"model": HealthCheckResponse}},
+    summary="Health Check Endpoint",
+)
 async def health_check():
     """
     Checks the health status of the application.
     Returns a simple JSON response indicating the service is healthy.
     """
-    import datetime
-    return HealthCheckResponse(
-        status="healthy",
-        timestamp=datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds") + "Z",
-        service=PROJECT_NAME
-    )
+    return _json_response({
+        "status": "healthy",
+        "timestamp": datetime.datetime.now(_UTC).isoformat(timespec="seconds") + "Z",
+        "service": PROJECT_NAME,
+    })
 
 # --- AI Routes (Conditional) ---
 
 if AI_ENABLED:
-    @app.post("/predict", response_model=PredictionOutput, summary="AI Inference Endpoint")
-    async def predict(input_data: PredictionInput):
-        """
-        Performs AI inference using the loaded model.
-        Expects a list of dictionaries as input and returns predictions.
-        """
+    def _run_prediction(arr: np.ndarray) -> List[float]:
+        """Runs the preprocessor and model over a 2-D feature array."""
         if ml_model is None or preprocessor is None:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -232,16 +422,70 @@ if AI_ENABLED:
             )
 
         try:
-            # 1. Preprocess the input data
-            processed_input = preprocessor.preprocess(input_data.data)
-            # 2. Make predictions using the model
-            predictions = ml_model.predict(processed_input)
-            return PredictionOutput(predictions=predictions, status="success")
+            # The preprocessor only scales its input, so instead of materializing the
+            # preprocessed array the model applies that scale in its single pass.
+            return ml_model.predict(arr, scale=preprocessor.scale)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"An error occurred during AI prediction: {e}"
             )
+
+    def _stream_predictions(predictions: List[float]):
+        """Yields a `PredictionOutput` JSON body, encoding the predictions chunk by chunk."""
+        yield b'{"predictions":['
+        for i in range(0, len(predictions), PREDICTION_STREAM_CHUNK_SIZE):
+            chunk = orjson.dumps(predictions[i:i + PREDICTION_STREAM_CHUNK_SIZE])[1:-1]
+            yield chunk if i == 0 else b"," + chunk
+        yield b'],"status":"success"}'
+
+    def _predictions_response(predictions: List[float]):
+        """Returns small results in one response and streams larger ones."""
+        if len(predictions) <= PREDICTION_STREAM_CHUNK_SIZE:
+            return _json_response({"predictions": predictions, "status": "success"})
+        return StreamingResponse(_stream_predictions(predictions), media_type="application/json")
+
+    @app.post(
+        "/predict",
+        responses={
+            200: {"model": PredictionOutput},
+            422: {
+                "description": "Malformed body, ragged columns or out-of-range values",
+                "content": {"application/json": {"example": {"detail": "Invalid prediction input: All columns must have the same number of values"}}},
+            },
+        },
+        openapi_extra={
+            "requestBody": {
+                "content": {"application/json": {"schema": PredictionInputSoA.model_json_schema()}},
+                "required": True,
+            }
+        },
+        summary="AI Inference Endpoint",
+    )
+    async def predict(request: Request):
+        """
+        Performs AI inference using the loaded model.
+        Expects one list of values per feature and returns one prediction per data point.
+        """
+        try:
+            input_data = msgspec.json.decode(await request.body(), type=PredictionInputStruct)
+            arr = _columns_to_array(input_data.columns)
+        except (msgspec.DecodeError, ValueError) as e:
+            # A literal 422: Starlette has renamed its constant, so neither name works on every version.
+            raise HTTPException(status_code=422, detail=f"Invalid prediction input: {e}")
+        return _predictions_response(_run_prediction(arr))
+
+    @app.post("/predict/legacy", response_model=PredictionOutput, summary="AI Inference Endpoint (Record Input)")
+    async def predict_legacy(input_data: PredictionInput):
+        """
+        Performs AI inference using the loaded model.
+        Expects a list of dictionaries as input and returns predictions.
+        """
+        try:
+            arr = _records_to_array(input_data.data)
+        except (OverflowError, ValueError) as e:
+            raise HTTPException(status_code=422, detail=f"Invalid prediction input: {e}")
+        return PredictionOutput(predictions=_run_prediction(arr), status="success")
 else:
     print("AI features are disabled as per configuration or due to loading errors.")
     @app.post("/predict", summary="AI Inference Endpoint (Disabled)")
@@ -255,3 +499,17 @@ else:
         )
 
 
+# --- Entrypoint ---
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop has no Windows build; httptools works everywhere.
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        workers=int(os.getenv("UVICORN_WORKERS", "4")),
+    )
@@ -0,0 +1,315 @@
+import importlib.util
+import json
+import os
+import random
+import sys
+import warnings
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+APP_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "generated_projects", "portfolio_website_with_blog", "backend", "app.py",
+)
+
+
+@pytest.fixture(scope="module")
+def backend(tmp_path_factory):
+    spec = importlib.util.spec_from_file_location("portfolio_backend_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    with pytest.MonkeyPatch.context() as mp:
+        # numba's on-disk cache is keyed by source file; keep entries compiled under this
+        # module name out of the app's own cache directory.
+        mp.setenv("NUMBA_CACHE_DIR", str(tmp_path_factory.mktemp("numba_cache")))
+        # Registered first so annotations resolve against the module, as on a normal import.
+        mp.setitem(sys.modules, spec.name, module)
+        spec.loader.exec_module(module)
+        assert module.AI_ENABLED
+        yield module
+
+
+@pytest.fixture(scope="module")
+def client(backend):
+    return TestClient(backend.app)
+
+
+def _baseline_predictions(data):
+    """The original per-record preprocess (x10) + predict (mean of numeric values) loops."""
+    predictions = []
+    for item in data:
+        processed = {k: v * 10 if isinstance(v, (int, float)) else v for k, v in item.items()}
+        numeric = [v for v in processed.values() if isinstance(v, (int, float))]
+        predictions.append(sum(numeric) / len(numeric) if numeric else 0.5)
+    return predictions
+
+
+def _random_records(rng, count):
+    keys = ["a", "b", "c", "d"]
+    values = [lambda: rng.uniform(-1e3, 1e3), lambda: rng.randint(-50, 50), lambda: rng.choice([True, False]),
+              lambda: "text", lambda: None]
+    return [
+        {k: rng.choice(values)() for k in rng.sample(keys, rng.randint(0, len(keys)))}
+        for _ in range(count)
+    ]
+
+
+def test_legacy_predictions_match_baseline_semantics(client):
+    data = [
+        {"feature1": 10, "feature2": 20},
+        {"a": "x"},
+        {"a": 1, "b": True, "c": "s"},
+        {"z": 3},
+        {},
+    ]
+
+    response = client.post("/predict/legacy", json={"data": data})
+
+    assert response.status_code == 200
+    assert response.json() == {"predictions": [150.0, 0.5, 10.0, 30.0, 0.5], "status": "success"}
+
+
+def test_legacy_predictions_match_baseline_on_random_input(client):
+    rng = random.Random(0)
+    for _ in range(50):
+        data = _random_records(rng, rng.randint(0, 8))
+
+        predictions = client.post("/predict/legacy", json={"data": data}).json()["predictions"]
+
+        np.testing.assert_allclose(predictions, _baseline_predictions(data), rtol=1e-12)
+
+
+def _sample(rows=64, cols=8, seed=0):
+    rng = np.random.default_rng(seed)
+    arr = rng.random((rows, cols)) * 200 - 100
+    arr[rng.random((rows, cols)) < 0.25] = np.nan
+    arr[5] = np.nan
+    return arr
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_score_kernels_agree(backend, dtype):
+    arr = _sample().astype(dtype)
+    expected = backend._score_numpy(arr, 10.0)
+
+    np.testing.assert_allclose(backend._score_loop(arr, 10.0), expected, rtol=1e-12)
+    np.testing.assert_allclose(backend._score(arr, 10.0), expected, rtol=1e-12)
+    np.testing.assert_allclose(backend._score(np.ascontiguousarray(arr.T).T, 10.0), expected, rtol=1e-12)
+    assert expected[5] == 0.5
+
+
+def test_score_applies_scale_to_row_means(backend):
+    arr = np.array([[1.0, 3.0], [np.nan, 4.0], [np.nan, np.nan]])
+
+    np.testing.assert_array_equal(backend._score(arr, 10.0), [20.0, 40.0, 0.5])
+    np.testing.assert_array_equal(backend._score(arr, 1.0), [2.0, 4.0, 0.5])
+
+
+def test_int8_within_one_quantization_step(backend):
+    arr = _sample(seed=1)
+    scale = 10.0
+    step = float(np.nanmax(np.abs(arr))) / 127.0 * scale
+
+    quantized = backend._score_int8(arr, scale)
+    reference = backend._score_numpy(arr, scale)
+
+    assert np.all(np.abs(quantized - reference) <= step)
+    assert quantized[5] == 0.5
+
+
+def test_int8_scores_tiny_values_without_overflow(client, backend, monkeypatch):
+    monkeypatch.setattr(backend, "ml_model", backend.MockModel("int8"))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        response = client.post("/predict", json={"columns": {"a": [1e-38, 5e-39]}})
+
+    np.testing.assert_allclose(response.json()["predictions"], [1e-37, 5e-38], rtol=1e-2)
+
+
+def test_int8_scores_infinite_input_unquantized(backend):
+    arr = np.array([[np.inf, 1.0], [2.0, np.nan]])
+
+    assert backend.MockModel("int8").predict(arr) == [np.inf, 2.0]
+
+
+def test_score_kernel_falls_back_to_numpy_when_numba_fails(backend, monkeypatch):
+    def failing_njit(*args, **kwargs):
+        raise RuntimeError("cannot cache function '_score_loop': no locator available")
+
+    monkeypatch.setattr(backend, "njit", failing_njit)
+
+    assert backend._build_score_kernel() is backend._score_numpy
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/", {"message": "Welcome to my Portfolio!", "page": "Home"}),
+    ("/portfolio", {"message": "Here are my projects.", "page": "Portfolio", "projects": ["Project A", "Project B", "Project C"]}),
+    ("/admin/login", {"message": "Admin login portal. Please provide credentials.", "page": "Admin Login"}),
+])
+def test_static_pages_serve_prebuilt_json(client, path, body):
+    for _ in range(2):
+        response = client.get(path)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == body
+
+
+ADMIN_PATHS = ("/admin/dashboard", "/admin/posts", "/admin/posts/edit/3")
+
+
+@pytest.mark.parametrize("path", ADMIN_PATHS)
+def test_admin_routes_reject_missing_or_wrong_token(client, path):
+    for headers in ({}, {"X-Admin-Token": "wrong"}, {"X-Admin-Token": "ünï".encode("latin-1")}):
+        response = client.get(path, headers=headers)
+
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Authentication failed: Invalid or missing admin token"}
+
+
+def test_admin_routes_accept_valid_token(client, backend):
+    headers = {"X-Admin-Token": backend.FAKE_ADMIN_TOKEN}
+
+    response = client.get("/admin/posts/edit/3", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json() == {"message": "Editing post with ID: 3", "page": "Admin Post Editor", "post_id": 3}
+    assert client.get("/admin/dashboard", headers=headers).json()["status"] == "authenticated"
+
+
+def test_health_reports_service_and_utc_timestamp(client, backend):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "healthy"
+    assert body["service"] == backend.PROJECT_NAME
+    assert body["timestamp"].endswith("+00:00Z")
+
+
+def test_predict_scores_columns(client):
+    response = client.post("/predict", json={"columns": {"f1": [10, 5], "f2": [20, 15.5]}})
+
+    assert response.status_code == 200
+    assert response.json() == {"predictions": [150.0, 102.5], "status": "success"}
+
+
+@pytest.mark.parametrize("columns", [{}, {"a": []}])
+def test_predict_with_no_data_points_returns_empty(client, columns):
+    response = client.post("/predict", json={"columns": columns})
+
+    assert response.status_code == 200
+    assert response.json() == {"predictions": [], "status": "success"}
+
+
+@pytest.mark.parametrize("body", [
+    {"columns": {"a": [1.0], "b": [1.0, 2.0]}},
+    {"columns": {"a": [1e39]}},
+    {"columns": {"a": [1.0, -1e39]}},
+    {"columns": {"a": ["x"]}},
+    {},
+])
+def test_predict_rejects_invalid_input(client, body):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        response = client.post("/predict", json=body)
+
+    assert response.status_code == 422
+
+
+def test_predict_rejects_malformed_body(client):
+    response = client.post("/predict", content=b"not json", headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 422
+
+
+def test_legacy_predict_keeps_float64_precision(client):
+    response = client.post("/predict/legacy", json={"data": [{"a": 0.1}, {"a": 10**40}]})
+
+    assert response.json()["predictions"] == [1.0, 1e41]
+
+
+@pytest.mark.parametrize("record", [{"a": 10**400}, {"a": 10**400, "b": -10**400}])
+def test_legacy_predict_rejects_values_beyond_float64(client, record):
+    response = client.post("/predict/legacy", json={"data": [record]})
+
+    assert response.status_code == 422
+
+
+def test_admin_token_check_is_memoized_per_token(client, backend):
+    headers = {"X-Admin-Token": backend.FAKE_ADMIN_TOKEN}
+    client.get("/admin/posts", headers=headers)
+    hits = backend._is_valid_admin_token.cache_info().hits
+
+    assert client.get("/admin/posts", headers=headers).status_code == 200
+    assert backend._is_valid_admin_token.cache_info().hits == hits + 1
+
+
+def test_predict_openapi_documents_body_and_422(client):
+    operation = client.get("/openapi.json").json()["paths"]["/predict"]["post"]
+
+    assert "columns" in operation["requestBody"]["content"]["application/json"]["schema"]["properties"]
+    assert set(operation["responses"]) == {"200", "422"}
+
+
+def test_cors_preflight_is_cacheable_and_narrowed(client):
+    response = client.options("/predict", headers={
+        "Origin": "https://example.com",
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "Content-Type",
+    })
+
+    assert response.status_code == 200
+    assert response.headers["access-control-max-age"] == "86400"
+    assert "DELETE" not in response.headers["access-control-allow-methods"]
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/portfolio/alpha", {"message": "Details for project: alpha", "page": "Portfolio Detail", "project_slug": "alpha"}),
+    ("/blog/hello", {"message": "Details for blog post: hello", "page": "Blog Post Detail", "post_slug": "hello"}),
+])
+def test_detail_pages_are_memoized_per_slug(client, backend, path, body):
+    cache = backend._portfolio_resp if path.startswith("/portfolio") else backend._blog_post_resp
+    client.get(path)
+    hits = cache.cache_info().hits
+
+    response = client.get(path)
+
+    assert response.json() == body
+    assert cache.cache_info().hits == hits + 1
+
+
+def test_predict_logs_row_count_at_debug_without_printing(client, backend, capsys, caplog):
+    with caplog.at_level("DEBUG", logger=backend.logger.name):
+        client.post("/predict", json={"columns": {"a": [1.0, 2.0, 3.0]}})
+
+    assert capsys.readouterr().out == ""
+    assert "MockModel received 3 rows for prediction" in caplog.messages
+
+
+@pytest.mark.parametrize("size", [4096, 4097, 3 * 4096 + 1])
+def test_stream_predictions_round_trips(backend, size):
+    predictions = [i * 0.25 - 7.5 for i in range(size)]
+
+    body = b"".join(backend._stream_predictions(predictions))
+
+    assert json.loads(body) == {"predictions": predictions, "status": "success"}
+
+
+def test_predict_streams_only_above_chunk_size(client, backend):
+    chunk = backend.PREDICTION_STREAM_CHUNK_SIZE
+    for size, streamed in ((chunk, False), (chunk + 1, True)):
+        columns = {"a": [float(i) for i in range(size)], "b": [1.0] * size}
+
+        response = client.post("/predict", json={"columns": columns})
+
+        assert response.status_code == 200
+        assert ("content-length" not in response.headers) == streamed
+        expected = [(i + 1.0) / 2 * 10 for i in range(size)]
+        np.testing.assert_allclose(response.json()["predictions"], expected)